@@ -305,8 +305,10 @@ Additionally, helper classes ``Date`` and ``Time`` can be used directly:
 """
 
 import datetime
+import re
 import sys
 import time
+from functools import lru_cache
 from typing import Any
 
 from robot.utils import (
@@ -319,6 +321,7 @@ __all__ = [
     "add_time_to_date",
     "add_time_to_time",
     "convert_date",
+    "convert_dates",
     "convert_time",
     "get_current_date",
     "subtract_date_from_date",
@@ -326,6 +329,30 @@ __all__ = [
     "subtract_time_from_time",
 ]
 
+_ONE_SECOND = datetime.timedelta(seconds=1)
+_NON_DIGITS = re.compile(r"[^0-9]+")
+# Same patterns as used by `strptime` internally.
+_FORMAT_DIRECTIVES = {
+    "Y": r"(?P<Y>\d\d\d\d)",
+    "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "d": r"(?P<d>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])",
+    "H": r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    "M": r"(?P<M>[0-5]\d|\d)",
+    "S": r"(?P<S>6[0-1]|[0-5]\d|\d)",
+    "f": r"(?P<f>[0-9]{1,6})",
+}
+_FORMAT_TOKENS = re.compile(r"%(.?)|(\s+)|([^%\s]+)", re.DOTALL)
+
+if sys.version_info >= (3, 12):
+
+    def _utcnow():
+        # `utcnow()` was deprecated in Python 3.12. We only support "naive"
+        # datetime objects and thus need to remove timezone information here.
+        return datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+
+else:
+    _utcnow = datetime.datetime.utcnow
+
 
 def get_current_date(
     time_zone="local",
@@ -358,18 +385,21 @@ def get_current_date(
     | Should Be Equal | ${date.year}     | ${2014}                 |
     | Should Be Equal | ${date.month}    | ${6}                    |
     """
-    if time_zone.upper() == "LOCAL" or result_format.upper() == "EPOCH":
+    if result_format.upper() == "EPOCH":
+        secs = time.time()
+        if increment:
+            secs += Time(increment).seconds
+        return secs if not exclude_millis else float(round(secs))
+    zone = time_zone.upper()
+    if zone == "LOCAL":
         dt = datetime.datetime.now()
-    elif time_zone.upper() == "UTC":
-        if sys.version_info >= (3, 12):
-            # `utcnow()` was deprecated in Python 3.12. We only support "naive"
-            # datetime objects and thus need to remove timezone information here.
-            dt = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
-        else:
-            dt = datetime.datetime.utcnow()
+    elif zone == "UTC":
+        dt = _utcnow()
     else:
         raise ValueError(f"Unsupported timezone '{time_zone}'.")
-    date = Date(dt) + Time(increment)
+    date = Date._from_datetime(dt)
+    if increment:
+        date += Time(increment)
     return date.convert(result_format, millis=not exclude_millis)
 
 
@@ -396,7 +426,42 @@ def convert_date(
     | ${date} =       | Convert Date | 5.28.2014 12:05         | exclude_millis=yes | date_format=%m.%d.%Y %H:%M |
     | Should Be Equal | ${date}      | 2014-05-28 12:05:00     |
     """
-    return Date(date, date_format).convert(result_format, millis=not exclude_millis)
+    if isinstance(date, datetime.datetime):
+        date = Date._from_datetime(date)
+    else:
+        date = Date(date, date_format)
+    return date.convert(result_format, millis=not exclude_millis)
+
+
+def convert_dates(
+    dates,
+    result_format="timestamp",
+    exclude_millis=False,
+    date_format=None,
+) -> list:
+    """Converts multiple dates between supported `date formats`.
+
+    Works like `Convert Date` but accepts a list of dates and returns a list
+    containing converted dates in the same order. Converting dates this way
+    is considerably faster than using `Convert Date` with each date
+    separately.
+
+    Arguments:
+    - ``dates:``          List of dates in one of the supported `date formats`.
+    - ``result_format:``  Format of the returned dates.
+    - ``exclude_millis:`` When set to any true value, rounds and drops
+                          milliseconds as explained in `millisecond handling`.
+    - ``date_format:``    Specifies possible `custom timestamp` format.
+
+    Examples:
+    | @{dates} =      | Convert Dates | ${{['20140528 12:05:03.111', '2014-05-29']}} |
+    | Should Be Equal | ${dates}      | ${{['2014-05-28 12:05:03.111', '2014-05-29 00:00:00.000']}} |
+    | @{dates} =      | Convert Dates | ${dates} | epoch | exclude_millis=yes |
+
+    New in Robot Framework 7.4.
+    """
+    millis = not exclude_millis
+    return [Date(d, date_format).convert(result_format, millis) for d in dates]
 
 
 def convert_time(time, result_format="number", exclude_millis=False) -> Any:
@@ -551,89 +616,207 @@ def subtract_time_from_time(
     return time.convert(result_format, millis=not exclude_millis)
 
 
+@lru_cache(maxsize=128)
+def _compile_timestamp_format(format):
+    """Compiles a custom timestamp format to a regular expression.
+
+    Only numeric date and time directives are supported. With other formats
+    returns ``None`` and the caller should use ``strptime`` instead.
+    """
+    pattern = []
+    seen = set()
+    for directive, space, literal in _FORMAT_TOKENS.findall(format):
+        if literal:
+            pattern.append(re.escape(literal))
+        elif space:
+            pattern.append(r"\s+")
+        elif directive == "%":
+            pattern.append("%")
+        elif directive in _FORMAT_DIRECTIVES and directive not in seen:
+            pattern.append(_FORMAT_DIRECTIVES[directive])
+            seen.add(directive)
+        else:
+            return None
+    return re.compile("".join(pattern), re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _timestr_to_secs(timestr):
+    return timestr_to_secs(timestr, round_to=None)
+
+
+def _is_cacheable(secs):
+    # Whole seconds up to one day are common results and cheap to cache.
+    return secs % 1 == 0 and -86400 <= secs <= 86400
+
+
+@lru_cache(maxsize=256)
+def _secs_to_timestr(secs, compact):
+    return secs_to_timestr(secs, compact)
+
+
+@lru_cache(maxsize=256)
+def _elapsed_time_to_string(secs, millis):
+    return elapsed_time_to_string(secs, include_millis=millis, seconds=True)
+
+
 class Date:
 
     def __init__(self, date, input_format=None):
         self.datetime = self._convert_to_datetime(date, input_format)
 
+    @classmethod
+    def _from_datetime(cls, dt):
+        date = cls.__new__(cls)
+        date.datetime = dt
+        return date
+
     @property
     def seconds(self):
         # Mainly for backwards compatibility with RF 2.9.1 and earlier.
         return self._convert_to_epoch(self.datetime)
 
     def _convert_to_datetime(self, date, input_format):
+        input_converter = self._input_converters.get(type(date))
+        if input_converter:
+            return input_converter(self, date, input_format)
         if isinstance(date, datetime.datetime):
             return date
         if isinstance(date, datetime.date):
-            return datetime.datetime(date.year, date.month, date.day)
+            return self._date_to_datetime(date)
         if isinstance(date, (int, float)):
             return self._epoch_seconds_to_datetime(date)
         if isinstance(date, str):
             return self._string_to_datetime(date, input_format)
         raise ValueError(f"Unsupported input '{date}'.")
 
+    def _date_to_datetime(self, date):
+        return datetime.datetime(date.year, date.month, date.day)
+
     def _epoch_seconds_to_datetime(self, secs):
         return datetime.datetime.fromtimestamp(secs)
 
     def _string_to_datetime(self, ts, input_format):
         if not input_format:
-            ts = self._normalize_timestamp(ts)
-            input_format = "%Y-%m-%d %H:%M:%S.%f"
+            return self._timestamp_to_datetime(ts)
+        pattern = _compile_timestamp_format(input_format)
+        match = pattern.match(ts) if pattern else None
+        if match and match.end() == len(ts):
+            try:
+                return self._match_to_datetime(match)
+            except ValueError:
+                pass
+        # Used also with invalid input to get the standard error message.
         return datetime.datetime.strptime(ts, input_format)
 
-    def _normalize_timestamp(self, timestamp):
-        numbers = "".join(d for d in timestamp if d.isdigit())
-        if not (8 <= len(numbers) <= 20):
-            raise ValueError(f"Invalid timestamp '{timestamp}'.")
-        d = numbers[:8]
-        t = numbers[8:].ljust(12, "0")
-        return f"{d[:4]}-{d[4:6]}-{d[6:8]} {t[:2]}:{t[2:4]}:{t[4:6]}.{t[6:]}"
+    def _match_to_datetime(self, match):
+        parts = match.groupdict()
+        micros = parts.get("f")
+        return datetime.datetime(
+            int(parts.get("Y", 1900)),
+            int(parts.get("m", 1)),
+            int(parts.get("d", 1)),
+            int(parts.get("H", 0)),
+            int(parts.get("M", 0)),
+            int(parts.get("S", 0)),
+            int(micros.ljust(6, "0")) if micros else 0,
+        )
+
+    def _timestamp_to_datetime(self, timestamp):
+        numbers = _NON_DIGITS.sub("", timestamp)
+        # Non-ASCII digits like `²` are neither valid digits nor separators.
+        if 8 <= len(numbers) <= 20 and not self._has_non_ascii_digits(timestamp):
+            try:
+                return datetime.datetime(*self._split_timestamp(numbers))
+            except ValueError:
+                pass
+        raise ValueError(f"Invalid timestamp '{timestamp}'.")
+
+    def _has_non_ascii_digits(self, timestamp):
+        return not timestamp.isascii() and any(
+            char.isdigit() for char in timestamp if not char.isascii()
+        )
+
+    def _split_timestamp(self, numbers):
+        # Converting digits to integers once and splitting them arithmetically
+        # is faster than converting each component separately.
+        date, rest = divmod(int(numbers.ljust(20, "0")), 10**12)
+        year, date = divmod(date, 10_000)
+        month, day = divmod(date, 100)
+        hour, rest = divmod(rest, 10**10)
+        minute, rest = divmod(rest, 10**8)
+        second, micro = divmod(rest, 10**6)
+        return year, month, day, hour, minute, second, micro
+
+    # Fast path for exact types. Subclasses are handled in `_convert_to_datetime`.
+    _input_converters = {
+        datetime.datetime: lambda self, date, input_format: date,
+        datetime.date: lambda self, date, input_format: self._date_to_datetime(date),
+        int: lambda self, secs, input_format: self._epoch_seconds_to_datetime(secs),
+        float: lambda self, secs, input_format: self._epoch_seconds_to_datetime(secs),
+        str: _string_to_datetime,
+    }
 
     def convert(self, format, millis=True):
         dt = self.datetime
+        if format == "datetime" and millis:
+            return dt
         if not millis:
-            secs = 1 if dt.microsecond >= 5e5 else 0
-            dt = dt.replace(microsecond=0) + datetime.timedelta(seconds=secs)
+            round_up = dt.microsecond >= 500_000
+            dt = dt.replace(microsecond=0)
+            if round_up:
+                dt += _ONE_SECOND
         if "%" in format:
             return self._convert_to_custom_timestamp(dt, format)
         format = format.lower()
-        if format == "timestamp":
-            return self._convert_to_timestamp(dt, millis)
-        if format == "datetime":
-            return dt
-        if format == "epoch":
-            return self._convert_to_epoch(dt)
-        raise ValueError(f"Unknown format '{format}'.")
+        try:
+            result_converter = self._result_converters[format]
+        except KeyError:
+            raise ValueError(f"Unknown format '{format}'.")
+        return result_converter(self, dt, millis)
 
     def _convert_to_custom_timestamp(self, dt, format):
         return dt.strftime(format)
 
     def _convert_to_timestamp(self, dt, millis=True):
         if not millis:
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
-        ms = round(dt.microsecond / 1000)
+            return self._format_timestamp(dt)
+        ms = (dt.microsecond + 500) // 1000
         if ms == 1000:
-            dt += datetime.timedelta(seconds=1)
+            dt += _ONE_SECOND
             ms = 0
-        return dt.strftime("%Y-%m-%d %H:%M:%S") + f".{ms:03d}"
+        return f"{self._format_timestamp(dt)}.{ms:03d}"
+
+    def _format_timestamp(self, dt):
+        # Considerably faster than `dt.strftime("%Y-%m-%d %H:%M:%S")`.
+        return (
+            f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+            f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+        )
 
-    def _convert_to_epoch(self, dt):
+    def _convert_to_epoch(self, dt, millis=True):
         try:
             return dt.timestamp()
         except OSError:
             # https://github.com/python/cpython/issues/81708
             return time.mktime(dt.timetuple()) + dt.microsecond / 1e6
 
+    _result_converters = {
+        "timestamp": _convert_to_timestamp,
+        "datetime": lambda self, dt, millis: dt,
+        "epoch": _convert_to_epoch,
+    }
+
     def __add__(self, other):
         if isinstance(other, Time):
-            return Date(self.datetime + other.timedelta)
+            return Date._from_datetime(self.datetime + other.timedelta)
         raise TypeError(f"Can only add Time to Date, got {type_name(other)}.")
 
     def __sub__(self, other):
         if isinstance(other, Date):
             return Time(self.datetime - other.datetime)
         if isinstance(other, Time):
-            return Date(self.datetime - other.timedelta)
+            return Date._from_datetime(self.datetime - other.timedelta)
         raise TypeError(
             f"Can only subtract Date or Time from Date, got {type_name(other)}."
         )
@@ -642,11 +825,13 @@ class Date:
 class Time:
 
     def __init__(self, time):
-        self.seconds = float(self._convert_time_to_seconds(time))
+        self.seconds = self._convert_time_to_seconds(time)
 
     def _convert_time_to_seconds(self, time):
         if isinstance(time, datetime.timedelta):
             return time.total_seconds()
+        if isinstance(time, str):
+            return _timestr_to_secs(time)
         return timestr_to_secs(time, round_to=None)
 
     @property
@@ -654,28 +839,44 @@ class Time:
         return datetime.timedelta(seconds=self.seconds)
 
     def convert(self, format, millis=True):
+        if format == "number" and millis:
+            return self.seconds
         try:
-            result_converter = getattr(self, f"_convert_to_{format.lower()}")
-        except AttributeError:
+            result_converter = self._result_converters[format.lower()]
+        except (KeyError, AttributeError):
             raise ValueError(f"Unknown format '{format}'.")
-        seconds = self.seconds if millis else float(round(self.seconds))
-        return result_converter(seconds, millis)
+        seconds = self.seconds if millis else round(self.seconds)
+        return result_converter(self, seconds, millis)
 
     def _convert_to_number(self, seconds, millis=True):
-        return seconds
+        return float(seconds)
 
     def _convert_to_verbose(self, seconds, millis=True):
+        if _is_cacheable(seconds):
+            return _secs_to_timestr(int(seconds), False)
         return secs_to_timestr(seconds)
 
     def _convert_to_compact(self, seconds, millis=True):
+        if _is_cacheable(seconds):
+            return _secs_to_timestr(int(seconds), True)
         return secs_to_timestr(seconds, compact=True)
 
     def _convert_to_timer(self, seconds, millis=True):
+        if _is_cacheable(seconds):
+            return _elapsed_time_to_string(int(seconds), millis)
         return elapsed_time_to_string(seconds, include_millis=millis, seconds=True)
 
     def _convert_to_timedelta(self, seconds, millis=True):
         return datetime.timedelta(seconds=seconds)
 
+    _result_converters = {
+        "number": _convert_to_number,
+        "verbose": _convert_to_verbose,
+        "compact": _convert_to_compact,
+        "timer": _convert_to_timer,
+        "timedelta": _convert_to_timedelta,
+    }
+
     def __add__(self, other):
         if isinstance(other, Time):
             return Time(self.seconds + other.seconds)
@@ -13,29 +13,42 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import codecs
 import fnmatch
 import glob
+import io
+import itertools
 import os
 import pathlib
 import re
 import shutil
-import tempfile
+import stat
+import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from unicodedata import normalize
 
 from robot.api import logger
 from robot.api.deco import keyword
 from robot.utils import (
     abspath, ConnectionCache, console_decode, CONSOLE_ENCODING, del_env_var,
-    get_env_var, get_env_vars, get_time, normpath, parse_time, plural_or_not as s,
-    PY_VERSION, safe_str, secs_to_timestr, seq2str, set_env_var, timestr_to_secs,
-    WINDOWS
+    get_env_var, get_env_vars, get_time, parse_time, plural_or_not as s, PY_VERSION,
+    safe_str, secs_to_timestr, seq2str, set_env_var, timestr_to_secs, WINDOWS
 )
 from robot.version import get_version
 
 __version__ = get_version()
 PROCESSES = ConnectionCache("No active processes.")
 
+_SPECIAL_ENCODINGS = {
+    "SYSTEM": "locale" if PY_VERSION > (3, 10) else None,
+    "CONSOLE": CONSOLE_ENCODING,
+}
+_TEXT_CHUNK_SIZE = 1024 * 1024
+_TEMP_FILE_COUNTER = itertools.count()
+
 
 class OperatingSystem:
     r"""A library providing keywords for operating system related tasks.
@@ -286,14 +299,16 @@ class OperatingSystem:
         # depend on these semantics. Best solution would probably be making
         # `newline` configurable.
         # FIXME: Make `newline` configurable or at least submit an issue about that.
+        if _is_ascii_compatible(encoding):
+            # Converting newlines before decoding is faster and needs less memory.
+            with open(path, "rb") as f:
+                content = f.read().replace(b"\r\n", b"\n")
+            return content.decode(encoding, encoding_errors)
         with open(path, encoding=encoding, errors=encoding_errors, newline="") as f:
             return f.read().replace("\r\n", "\n")
 
     def _map_encoding(self, encoding):
-        return {
-            "SYSTEM": "locale" if PY_VERSION > (3, 10) else None,
-            "CONSOLE": CONSOLE_ENCODING,
-        }.get(encoding.upper(), encoding)
+        return _SPECIAL_ENCODINGS.get(encoding.upper(), encoding)
 
     def get_binary_file(self, path) -> bytes:
         """Returns the contents of a specified file.
@@ -349,21 +364,28 @@ class OperatingSystem:
         Support for regular expressions is new in Robot Framework 5.0.
         """
         path = self._absnorm(path)
-        if not regexp:
-            pattern = fnmatch.translate(f"{pattern}*")
-        reobj = re.compile(pattern)
+        if regexp or self._is_glob_path(pattern):
+            reobj = _compile_grep_pattern(pattern, bool(regexp))
+        else:
+            reobj = None
         encoding = self._map_encoding(encoding)
-        lines = []
-        total_lines = 0
+        result = io.StringIO()
+        matched = total_lines = 0
         self._link("Reading file '%s'.", path)
         with open(path, encoding=encoding, errors=encoding_errors) as file:
-            for line in file:
-                total_lines += 1
-                line = line.rstrip("\r\n")
-                if reobj.search(line):
-                    lines.append(line)
-            self._info(f"{len(lines)} out of {total_lines} lines matched.")
-            return "\n".join(lines)
+            for lines in _read_line_blocks(file):
+                total_lines += len(lines)
+                if reobj:
+                    matches = list(filter(reobj.search, lines))
+                else:
+                    # Patterns without wildcards are plain substrings.
+                    matches = [line for line in lines if pattern in line]
+                if matches:
+                    result.write("\n".join(matches))
+                    result.write("\n")
+                    matched += len(matches)
+            self._info(f"{matched} out of {total_lines} lines matched.")
+            return result.getvalue()[:-1]
 
     def log_file(self, path, encoding="UTF-8", encoding_errors="strict") -> str:
         """Wrapper for `Get File` that also logs the returned file.
@@ -409,7 +431,23 @@ class OperatingSystem:
         self._link("Path '%s' does not exist.", path)
 
     def _glob(self, path):
-        return glob.glob(path) if not os.path.exists(path) else [path]
+        if os.path.lexists(path):
+            return [path]
+        return glob.glob(path) if self._is_glob_path(path) else []
+
+    def _glob_by_mode(self, path, is_mode):
+        paths = self._glob(path) if self._is_glob_path(path) else [path]
+        return [p for p in paths if self._has_mode(p, is_mode)]
+
+    def _has_mode(self, path, is_mode):
+        st = self._stat(path)
+        return bool(st and is_mode(st.st_mode))
+
+    def _stat(self, path):
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
 
     def _get_matches_error(self, kind, path, matches):
         if not self._is_glob_path(path):
@@ -428,7 +466,7 @@ class OperatingSystem:
         The default error message can be overridden with the ``msg`` argument.
         """
         path = self._absnorm(path)
-        matches = [p for p in self._glob(path) if os.path.isfile(p)]
+        matches = self._glob_by_mode(path, stat.S_ISREG)
         if not matches:
             self._fail(msg, f"File '{path}' does not exist.")
         self._link("File '%s' exists.", path)
@@ -442,7 +480,7 @@ class OperatingSystem:
         The default error message can be overridden with the ``msg`` argument.
         """
         path = self._absnorm(path)
-        matches = [p for p in self._glob(path) if os.path.isfile(p)]
+        matches = self._glob_by_mode(path, stat.S_ISREG)
         if matches:
             self._fail(msg, self._get_matches_error("File", path, matches))
         self._link("File '%s' does not exist.", path)
@@ -456,7 +494,7 @@ class OperatingSystem:
         The default error message can be overridden with the ``msg`` argument.
         """
         path = self._absnorm(path)
-        matches = [p for p in self._glob(path) if os.path.isdir(p)]
+        matches = self._glob_by_mode(path, stat.S_ISDIR)
         if not matches:
             self._fail(msg, f"Directory '{path}' does not exist.")
         self._link("Directory '%s' exists.", path)
@@ -470,7 +508,7 @@ class OperatingSystem:
         The default error message can be overridden with the ``msg`` argument.
         """
         path = self._absnorm(path)
-        matches = [p for p in self._glob(path) if os.path.isdir(p)]
+        matches = self._glob_by_mode(path, stat.S_ISDIR)
         if matches:
             self._fail(msg, self._get_matches_error("Directory", path, matches))
         self._link("Directory '%s' does not exist.", path)
@@ -495,11 +533,8 @@ class OperatingSystem:
         """
         path = self._absnorm(path)
         timeout = timestr_to_secs(timeout)
-        maxtime = time.time() + timeout
-        while self._glob(path):
-            if timeout >= 0 and time.time() > maxtime:
-                self._fail(f"'{path}' was not removed in {secs_to_timestr(timeout)}.")
-            time.sleep(0.1)
+        if not self._wait_until(lambda: not self._glob(path), timeout):
+            self._fail(f"'{path}' was not removed in {secs_to_timestr(timeout)}.")
         self._link("'%s' was removed.", path)
 
     def wait_until_created(self, path, timeout="1 minute"):
@@ -520,13 +555,22 @@ class OperatingSystem:
         """
         path = self._absnorm(path)
         timeout = timestr_to_secs(timeout)
-        maxtime = time.time() + timeout
-        while not self._glob(path):
-            if timeout >= 0 and time.time() > maxtime:
-                self._fail(f"'{path}' was not created in {secs_to_timestr(timeout)}.")
-            time.sleep(0.1)
+        if not self._wait_until(lambda: self._glob(path), timeout):
+            self._fail(f"'{path}' was not created in {secs_to_timestr(timeout)}.")
         self._link("'%s' was created.", path)
 
+    def _wait_until(self, condition, timeout, interval=0.1):
+        maxtime = time.time() + timeout
+        while not condition():
+            if timeout < 0:
+                time.sleep(interval)
+                continue
+            remaining = maxtime - time.time()
+            if remaining <= 0:
+                return False
+            time.sleep(min(interval, remaining))
+        return True
+
     # Dir/file empty
 
     def directory_should_be_empty(self, path, msg=None):
@@ -535,8 +579,11 @@ class OperatingSystem:
         The default error message can be overridden with the ``msg`` argument.
         """
         path = self._absnorm(path)
-        items = self._list_dir(path)
-        if items:
+        self._prepare_listing(path)
+        with os.scandir(path) as entries:
+            empty = next(entries, None) is None
+        if not empty:
+            items = sorted(safe_str(item) for item in os.listdir(path))
             contents = seq2str(items, lastsep=", ")
             self._fail(msg, f"Directory '{path}' is not empty. Contents: {contents}.")
         self._link("Directory '%s' is empty.", path)
@@ -547,10 +594,11 @@ class OperatingSystem:
         The default error message can be overridden with the ``msg`` argument.
         """
         path = self._absnorm(path)
-        items = self._list_dir(path)
-        if not items:
+        self._prepare_listing(path)
+        count = len(os.listdir(path))
+        if not count:
             self._fail(msg, f"Directory '{path}' is empty.")
-        self._link(f"Directory '%s' contains {len(items)} item{s(items)}.", path)
+        self._link(f"Directory '%s' contains {count} item{s(count)}.", path)
 
     def file_should_be_empty(self, path, msg=None):
         """Fails unless the specified file is empty.
@@ -558,9 +606,7 @@ class OperatingSystem:
         The default error message can be overridden with the ``msg`` argument.
         """
         path = self._absnorm(path)
-        if not os.path.isfile(path):
-            self._error(f"File '{path}' does not exist.")
-        size = os.stat(path).st_size
+        size = self._get_size(path)
         if size > 0:
             self._fail(msg, f"File '{path}' is not empty. Size: {size} byte{s(size)}.")
         self._link("File '%s' is empty.", path)
@@ -571,13 +617,17 @@ class OperatingSystem:
         The default error message can be overridden with the ``msg`` argument.
         """
         path = self._absnorm(path)
-        if not os.path.isfile(path):
-            self._error(f"File '{path}' does not exist.")
-        size = os.stat(path).st_size
+        size = self._get_size(path)
         if size == 0:
             self._fail(msg, f"File '{path}' is empty.")
         self._link(f"File '%s' contains {size} bytes.", path)
 
+    def _get_size(self, path):
+        st = self._stat(path)
+        if not (st and stat.S_ISREG(st.st_mode)):
+            self._error(f"File '{path}' does not exist.")
+        return st.st_size
+
     # Creating and removing files and directory
 
     def create_file(self, path, content="", encoding="UTF-8"):
@@ -614,7 +664,12 @@ class OperatingSystem:
         if encoding:
             encoding = self._map_encoding(encoding)
         with open(path, mode, encoding=encoding) as f:
-            f.write(content)
+            if "b" in mode:
+                f.write(content)
+            else:
+                # Encoding big strings in chunks avoids a full encoded copy.
+                for start in range(0, len(content), _TEXT_CHUNK_SIZE):
+                    f.write(content[start : start + _TEXT_CHUNK_SIZE])
         return path
 
     def create_binary_file(self, path, content):
@@ -639,7 +694,10 @@ class OperatingSystem:
         existing files.
         """
         if isinstance(content, str):
-            content = bytes(ord(c) for c in content)
+            try:
+                content = content.encode("latin-1")
+            except UnicodeEncodeError:
+                raise ValueError("bytes must be in range(0, 256)") from None
         path = self._write_to_file(path, content, mode="wb")
         self._link("Created binary file '%s'.", path)
 
@@ -667,14 +725,19 @@ class OperatingSystem:
         If the path is a pattern, all files matching it are removed.
         """
         path = self._absnorm(path)
-        matches = self._glob(path)
-        if not matches:
-            self._link("File '%s' does not exist.", path)
+        matches = self._glob(path) if self._is_glob_path(path) else [path]
+        removed = False
         for match in matches:
-            if not os.path.isfile(match):
+            st = self._stat(match)
+            if not st and not os.path.lexists(match):
+                continue
+            if not (st and stat.S_ISREG(st.st_mode)):
                 self._error(f"Path '{path}' is not a file.")
             os.remove(match)
             self._link("Removed file '%s'.", match)
+            removed = True
+        if not removed:
+            self._link("File '%s' does not exist.", path)
 
     def remove_files(self, *paths):
         """Uses `Remove File` to remove multiple files one-by-one.
@@ -685,19 +748,37 @@ class OperatingSystem:
         for path in paths:
             self.remove_file(path)
 
-    def empty_directory(self, path):
+    def empty_directory(self, path, max_workers=1):
         """Deletes all the content from the given directory.
 
         Deletes both files and sub-directories, but the specified directory
         itself if not removed. Use `Remove Directory` if you want to remove
         the whole directory.
+
+        By default sub-directories are removed one by one. If ``max_workers``
+        is given a value larger than one, they are removed in parallel using
+        that many threads. That can make emptying directories containing big
+        directory trees considerably faster.
+
+        ``max_workers`` is new in Robot Framework 7.4.
         """
         path = self._absnorm(path)
-        for item in self._list_dir(path, absolute=True):
-            if os.path.isdir(item):
-                shutil.rmtree(item)
+        self._prepare_listing(path)
+        with os.scandir(path) as entries:
+            entries = list(entries)
+        dirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                dirs.append(entry.path)
             else:
-                os.remove(item)
+                os.remove(entry.path)
+        if max_workers > 1 and len(dirs) > 1:
+            with ThreadPoolExecutor(max_workers) as executor:
+                # Consuming results re-raises possible errors.
+                list(executor.map(shutil.rmtree, dirs))
+        else:
+            for directory in dirs:
+                shutil.rmtree(directory)
         self._link("Emptied directory '%s'.", path)
 
     def create_directory(self, path):
@@ -708,9 +789,10 @@ class OperatingSystem:
         a directory.
         """
         path = self._absnorm(path)
-        if os.path.isdir(path):
+        st = self._stat(path)
+        if st and stat.S_ISDIR(st.st_mode):
             self._link("Directory '%s' already exists.", path)
-        elif os.path.exists(path):
+        elif st:
             self._error(f"Path '{path}' is not a directory.")
         else:
             os.makedirs(path)
@@ -727,9 +809,10 @@ class OperatingSystem:
         passes, but it fails, if the ``path`` points to a file.
         """
         path = self._absnorm(path)
-        if not os.path.exists(path):
+        st = self._stat(path)
+        if not st:
             self._link("Directory '%s' does not exist.", path)
-        elif not os.path.isdir(path):
+        elif not stat.S_ISDIR(st.st_mode):
             self._error(f"Path '{path}' is not a directory.")
         else:
             if recursive:
@@ -778,8 +861,8 @@ class OperatingSystem:
 
     def _prepare_copy_and_move_file(self, source, destination):
         source = self._normalize_copy_and_move_source(source)
-        destination = self._normalize_copy_and_move_destination(destination)
-        if os.path.isdir(destination):
+        destination, is_dir = self._normalize_copy_and_move_destination(destination)
+        if is_dir:
             destination = os.path.join(destination, os.path.basename(source))
         return source, destination
 
@@ -790,41 +873,43 @@ class OperatingSystem:
             self._error(f"Multiple matches with source pattern '{source}'.")
         if sources:
             source = sources[0]
-        if not os.path.exists(source):
+        st = self._stat(source)
+        if not st:
             self._error(f"Source file '{source}' does not exist.")
-        if not os.path.isfile(source):
+        if not stat.S_ISREG(st.st_mode):
             self._error(f"Source file '{source}' is not a regular file.")
         return source
 
     def _normalize_copy_and_move_destination(self, destination):
         if isinstance(destination, pathlib.Path):
             destination = str(destination)
-        is_dir = os.path.isdir(destination) or destination.endswith(("/", "\\"))
+        is_existing_dir = self._has_mode(destination, stat.S_ISDIR)
+        is_dir = is_existing_dir or destination.endswith(("/", "\\"))
         destination = self._absnorm(destination)
-        directory = destination if is_dir else os.path.dirname(destination)
-        self._ensure_destination_directory_exists(directory)
-        return destination
+        if not is_existing_dir:
+            directory = destination if is_dir else os.path.dirname(destination)
+            self._ensure_destination_directory_exists(directory)
+        return destination, is_dir
 
     def _ensure_destination_directory_exists(self, path):
-        if not os.path.exists(path):
+        st = self._stat(path)
+        if not st:
             os.makedirs(path)
-        elif not os.path.isdir(path):
+        elif not stat.S_ISDIR(st.st_mode):
             self._error(f"Destination '{path}' exists and is not a directory.")
 
     def _are_source_and_destination_same_file(self, source, destination):
-        if self._force_normalize(source) == self._force_normalize(destination):
+        try:
+            same = os.path.samefile(source, destination)
+        except OSError:  # Either path does not exist.
+            return False
+        if same:
             self._link(
                 "Source '%s' and destination '%s' point to the same file.",
                 source,
                 destination,
             )
-            return True
-        return False
-
-    def _force_normalize(self, path):
-        # TODO: Should normalize_path also support link normalization?
-        # TODO: Should we handle dos paths like 'exampl~1.txt'?
-        return os.path.realpath(normpath(path, case_normalize=True))
+        return same
 
     def _atomic_copy(self, source, destination):
         """Copy file atomically (or at least try to).
@@ -835,21 +920,22 @@ class OperatingSystem:
 
         Luckily moving files is atomic in almost every platform, assuming files
         are on the same filesystem, and we can use that as a workaround:
-        - First move the source to a temporary directory that is ensured to
-          be on the same filesystem as the destination.
-        - Move the temporary file over the real destination.
+        - First copy the source to a temporary file in the destination
+          directory. That ensures it is on the same filesystem.
+        - Replace the real destination with the temporary file.
 
         See also https://github.com/robotframework/robotframework/issues/1502
         """
-        temp_directory = tempfile.mkdtemp(dir=os.path.dirname(destination))
-        temp_file = os.path.join(temp_directory, os.path.basename(source))
+        fd, temp_file = _create_temp_file(os.path.dirname(destination))
         try:
-            shutil.copy(source, temp_file)
-            if os.path.exists(destination):
-                os.remove(destination)
-            shutil.move(temp_file, destination)
-        finally:
-            shutil.rmtree(temp_directory)
+            with open(fd, "wb") as temp, open(source, "rb") as src:
+                shutil.copyfileobj(src, temp)
+            shutil.copymode(source, temp_file)
+            os.replace(temp_file, destination)
+        except BaseException:
+            if os.path.lexists(temp_file):
+                os.remove(temp_file)
+            raise
         return source, destination
 
     def move_file(self, source, destination) -> str:
@@ -870,7 +956,7 @@ class OperatingSystem:
             self._link("Moved file from '%s' to '%s'.", source, destination)
         return destination
 
-    def copy_files(self, *sources_and_destination):
+    def copy_files(self, *sources_and_destination, max_workers=1):
         """Copies specified files to the target directory.
 
         Source files can be given as exact paths and as glob patterns (see
@@ -880,15 +966,27 @@ class OperatingSystem:
         Last argument must be the destination directory. If the destination
         does not exist, it will be created.
 
+        By default files are copied one by one. If ``max_workers`` is given
+        a value larger than one, files are copied in parallel using that many
+        threads. That can make copying lot of files considerably faster
+        especially when the destination is on a network drive.
+
         Examples:
         | Copy Files | ${dir}/file1.txt  | ${dir}/file2.txt | ${dir2} |
         | Copy Files | ${dir}/file-*.txt | ${dir2}          |         |
+        | Copy Files | ${dir}/file-*.txt | ${dir2}          | max_workers=4 |
 
         See also `Copy File`, `Move File`, and `Move Files`.
+
+        ``max_workers`` is new in Robot Framework 7.4.
         """
         sources, dest = self._prepare_copy_and_move_files(sources_and_destination)
-        for source in sources:
-            self.copy_file(source, dest)
+        if max_workers > 1:
+            message = "Copied file from '%s' to '%s'."
+            self._transfer_files(sources, dest, self._atomic_copy, message, max_workers)
+        else:
+            for source in sources:
+                self.copy_file(source, dest)
 
     def _prepare_copy_and_move_files(self, items):
         if len(items) < 2:
@@ -900,20 +998,58 @@ class OperatingSystem:
 
     def _glob_files(self, patterns):
         files = []
+        # Directories are listed only once even if many patterns target them.
+        listings = {}
         for pattern in patterns:
-            files.extend(self._glob(self._absnorm(pattern)))
+            path = self._absnorm(pattern)
+            directory, name = os.path.split(path)
+            if os.path.lexists(path):
+                files.append(path)
+            elif self._is_glob_path(name) and not self._is_glob_path(directory):
+                if directory not in listings:
+                    listings[directory] = _list_names(directory)
+                names = listings[directory]
+                if not name.startswith("."):
+                    names = [n for n in names if not n.startswith(".")]
+                matches = fnmatch.filter(names, name)
+                files.extend(os.path.join(directory, m) for m in matches)
+            elif self._is_glob_path(path):
+                files.extend(glob.glob(path))
         return files
 
-    def move_files(self, *sources_and_destination):
+    def move_files(self, *sources_and_destination, max_workers=1):
         """Moves specified files to the target directory.
 
         Arguments have exactly same semantics as with `Copy Files` keyword.
 
         See also `Move File`, `Copy File`, and `Copy Files`.
+
+        ``max_workers`` is new in Robot Framework 7.4.
         """
         sources, dest = self._prepare_copy_and_move_files(sources_and_destination)
+        if max_workers > 1:
+            message = "Moved file from '%s' to '%s'."
+            self._transfer_files(sources, dest, shutil.move, message, max_workers)
+        else:
+            for source in sources:
+                self.move_file(source, dest)
+
+    def _transfer_files(self, sources, destination, transfer, message, max_workers):
+        # Only the actual transfer is done in worker threads, because messages
+        # logged by other than the main thread are ignored.
+        jobs = []
         for source in sources:
-            self.move_file(source, dest)
+            source, dest = self._prepare_copy_and_move_file(source, destination)
+            if not self._are_source_and_destination_same_file(source, dest):
+                jobs.append((source, dest))
+        # Transfers to same destination must be done in order.
+        if len({dest for _, dest in jobs}) < len(jobs):
+            max_workers = 1
+        with ThreadPoolExecutor(max_workers) as executor:
+            futures = [executor.submit(transfer, *job) for job in jobs]
+        for (source, dest), future in zip(jobs, futures):
+            future.result()
+            self._link(message, source, dest)
 
     def copy_directory(self, source, destination):
         """Copies the source directory into the destination.
@@ -929,13 +1065,15 @@ class OperatingSystem:
     def _prepare_copy_and_move_directory(self, source, destination) -> tuple[str, str]:
         source = self._absnorm(source)
         destination = self._absnorm(destination)
-        if not os.path.exists(source):
+        st = self._stat(source)
+        if not st:
             self._error(f"Source '{source}' does not exist.")
-        if not os.path.isdir(source):
+        if not stat.S_ISDIR(st.st_mode):
             self._error(f"Source '{source}' is not a directory.")
-        if os.path.exists(destination) and not os.path.isdir(destination):
+        st = self._stat(destination)
+        if st and not stat.S_ISDIR(st.st_mode):
             self._error(f"Destination '{destination}' is not a directory.")
-        if os.path.exists(destination):
+        if st:
             base = os.path.basename(source)
             destination = os.path.join(destination, base)
         else:
@@ -1004,9 +1142,8 @@ class OperatingSystem:
         | Append To Environment Variable | NAME2    | second | separator=-     |
         | Should Be Equal                | %{NAME2} | first-second             |
         """
-        sentinel = object()
-        initial = self.get_environment_variable(name, sentinel)
-        if initial is not sentinel:
+        initial = get_env_var(name)
+        if initial is not None:
             values = (initial, *values)
         self.set_environment_variable(name, separator.join(values))
 
@@ -1061,8 +1198,8 @@ class OperatingSystem:
         `Get Environment Variables` keyword.
         """
         variables = get_env_vars()
-        for name in sorted(variables, key=lambda item: item.lower()):
-            self._log(f"{name} = {variables[name]}", level)
+        for name, value in sorted(variables.items(), key=lambda i: i[0].lower()):
+            self._log(f"{name} = {value}", level)
         return variables
 
     # Path
@@ -1089,7 +1226,7 @@ class OperatingSystem:
         """
         # FIXME: Is normalizing parts needed anymore?
         parts = [
-            str(p) if isinstance(p, pathlib.Path) else p.replace("/", os.sep)
+            str(p) if isinstance(p, pathlib.Path) else _to_native_separators(p)
             for p in (base, *parts)
         ]
         return self.normalize_path(os.path.join(*parts))
@@ -1108,7 +1245,21 @@ class OperatingSystem:
         - @{p2} = ['/example', '/my/base/other']
         - @{p3} = ['my/base/example/path', 'my/base/other', 'my/base/one/more']
         """
-        return [self.join_path(base, path) for path in paths]
+        # Normalize base only once. An empty base is kept as-is so that
+        # the possible `~` in paths is still expanded like with `Join Path`.
+        if isinstance(base, pathlib.Path):
+            base = str(base)
+        if base:
+            base = _normalize_path(base)
+        return [
+            _normalize_path(
+                os.path.join(
+                    base,
+                    str(p) if isinstance(p, pathlib.Path) else _to_native_separators(p),
+                )
+            )
+            for p in paths
+        ]
 
     def normalize_path(self, path, case_normalize=False) -> str:
         """Normalizes the given path.
@@ -1136,16 +1287,7 @@ class OperatingSystem:
         """
         if isinstance(path, pathlib.Path):
             path = str(path)
-        else:
-            path = path.replace("/", os.sep)
-        path = os.path.normpath(os.path.expanduser(path))
-        # os.path.normcase doesn't normalize on OSX which also, by default,
-        # has case-insensitive file system. Our robot.utils.normpath would
-        # do that, but it's not certain would that, or other things that the
-        # utility do, desirable.
-        if case_normalize:
-            path = os.path.normcase(path)
-        return path or "."
+        return _normalize_path(path, case_normalize)
 
     def split_path(self, path) -> tuple[str, str]:
         """Splits the given path from the last path separator (``/`` or ``\\``).
@@ -1193,23 +1335,12 @@ class OperatingSystem:
         - ${p6} = 'path/.file' & ${e6} = ''
         """
         path = self.normalize_path(path)
-        basename = os.path.basename(path)
-        if basename.startswith("." * basename.count(".")):
+        # Leading and trailing dots are not extension separators.
+        if "." not in os.path.basename(path).strip("."):
             return path, ""
-        if path.endswith("."):
-            path2 = path.rstrip(".")
-            trailing_dots = "." * (len(path) - len(path2))
-            path = path2
-        else:
-            trailing_dots = ""
-        basepath, extension = os.path.splitext(path)
-        if extension.startswith("."):
-            extension = extension[1:]
-        if extension:
-            extension += trailing_dots
-        else:
-            basepath += trailing_dots
-        return basepath, extension
+        stripped = path.rstrip(".")
+        basepath, _, extension = stripped.rpartition(".")
+        return basepath, extension + path[len(stripped) :]
 
     # Misc
 
@@ -1249,9 +1380,10 @@ class OperatingSystem:
         - @{time} = ['2006', '03', '29', '15', '06', '21']
         """
         path = self._absnorm(path)
-        if not os.path.exists(path):
+        st = self._stat(path)
+        if not st:
             self._error(f"Path '{path}' does not exist.")
-        mtime = get_time(format, os.stat(path).st_mtime)
+        mtime = get_time(format, st.st_mtime)
         self._link(f"Last modified time of '%s' is {mtime}.", path)
         return mtime
 
@@ -1293,21 +1425,19 @@ class OperatingSystem:
         """
         mtime = parse_time(mtime)
         path = self._absnorm(path)
-        if not os.path.exists(path):
+        st = self._stat(path)
+        if not st:
             self._error(f"File '{path}' does not exist.")
-        if not os.path.isfile(path):
+        if not stat.S_ISREG(st.st_mode):
             self._error(f"Path '{path}' is not a regular file.")
         os.utime(path, (mtime, mtime))
-        time.sleep(0.1)  # Give OS some time to really set these times.
         tstamp = datetime.fromtimestamp(mtime).isoformat(" ", timespec="seconds")
         self._link(f"Set modified time of '%s' to {tstamp}.", path)
 
     def get_file_size(self, path) -> int:
         """Returns and logs file size as an integer in bytes."""
         path = self._absnorm(path)
-        if not os.path.isfile(path):
-            self._error(f"File '{path}' does not exist.")
-        size = os.stat(path).st_size
+        size = self._get_size(path)
         self._link(f"Size of file '%s' is {size} byte{s(size)}.", path)
         return size
 
@@ -1360,50 +1490,63 @@ class OperatingSystem:
         keyword. The count is returned as an integer, so it must be checked e.g.
         with the built-in keyword `Should Be Equal As Integers`.
         """
-        count = len(self._list_dir(path, pattern))
+        count = self._count_in_dir(path, pattern)
         self._info(f"{count} item{s(count)}.")
         return count
 
     def count_files_in_directory(self, path, pattern=None) -> int:
         """Wrapper for `Count Items In Directory` returning only file count."""
-        count = len(self._list_files_in_dir(path, pattern))
+        count = self._count_in_dir(path, pattern, os.DirEntry.is_file)
         self._info(f"{count} file{s(count)}.")
         return count
 
     def count_directories_in_directory(self, path, pattern=None) -> int:
         """Wrapper for `Count Items In Directory` returning only directory count."""
-        count = len(self._list_dirs_in_dir(path, pattern))
+        count = self._count_in_dir(path, pattern, os.DirEntry.is_dir)
         label = "directory" if count == 1 else "directories"
         self._info(f"{count} {label}.")
         return count
 
-    def _list_dir(self, path, pattern=None, absolute=False):
+    def _list_dir(self, path, pattern=None, absolute=False, is_kind=None):
+        path = self._absnorm(path)
+        items = sorted(self._scan_dir(path, pattern, is_kind))
+        if absolute:
+            # `path` is normalized, so plain concatenation is enough.
+            prefix = os.path.join(os.path.normpath(path), "")
+            items = [prefix + item for item in items]
+        return items
+
+    def _count_in_dir(self, path, pattern=None, is_kind=None):
         path = self._absnorm(path)
+        return sum(1 for _ in self._scan_dir(path, pattern, is_kind))
+
+    def _scan_dir(self, path, pattern=None, is_kind=None):
+        self._prepare_listing(path)
+        match = _compile_glob_pattern(pattern).match if pattern else None
+        with os.scandir(path) as entries:
+            for entry in entries:
+                # Names are already strings, but they may need NFC normalization.
+                # ASCII names are always normalized, so they can be skipped.
+                name = entry.name
+                if not name.isascii():
+                    name = normalize("NFC", name)
+                if match and not match(name):
+                    continue
+                # Directory entries know their type without additional stat calls.
+                if is_kind and not is_kind(entry):
+                    continue
+                yield name
+
+    def _prepare_listing(self, path):
         self._link("Listing contents of directory '%s'.", path)
         if not os.path.isdir(path):
             self._error(f"Directory '{path}' does not exist.")
-        # result is already unicode but safe_str also handles NFC normalization
-        items = sorted(safe_str(item) for item in os.listdir(path))
-        if pattern:
-            items = [i for i in items if fnmatch.fnmatchcase(i, pattern)]
-        if absolute:
-            path = os.path.normpath(path)
-            items = [os.path.join(path, item) for item in items]
-        return items
 
     def _list_files_in_dir(self, path, pattern=None, absolute=False):
-        return [
-            item
-            for item in self._list_dir(path, pattern, absolute)
-            if os.path.isfile(os.path.join(path, item))
-        ]
+        return self._list_dir(path, pattern, absolute, os.DirEntry.is_file)
 
     def _list_dirs_in_dir(self, path, pattern=None, absolute=False):
-        return [
-            item
-            for item in self._list_dir(path, pattern, absolute)
-            if os.path.isdir(os.path.join(path, item))
-        ]
+        return self._list_dir(path, pattern, absolute, os.DirEntry.is_dir)
 
     def touch(self, path):
         """Emulates the UNIX touch command.
@@ -1415,25 +1558,37 @@ class OperatingSystem:
         file does not exist.
         """
         path = self._absnorm(path)
-        if os.path.isdir(path):
+        st = self._stat(path)
+        if st and stat.S_ISDIR(st.st_mode):
             self._error(f"Cannot touch '{path}' because it is a directory.")
-        if not os.path.exists(os.path.dirname(path)):
+        if st:
+            os.utime(path)
+            self._link("Touched existing file '%s'.", path)
+            return
+        # Missing parent is noticed when creating the file, no need to stat it.
+        try:
+            os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666))
+        except FileNotFoundError:
             self._error(
                 f"Cannot touch '{path}' because its parent directory does not exist."
             )
-        if os.path.exists(path):
-            mtime = round(time.time())
-            os.utime(path, (mtime, mtime))
-            self._link("Touched existing file '%s'.", path)
-        else:
-            open(path, "w", encoding="ASCII").close()
-            self._link("Touched new file '%s'.", path)
+        self._link("Touched new file '%s'.", path)
 
     def _absnorm(self, path):
-        return abspath(self.normalize_path(path))
+        if isinstance(path, pathlib.Path):
+            path = str(path)
+        # Results depend on the home directory only with paths starting with `~`.
+        if path.startswith("~"):
+            return abspath(_normalize_path(path))
+        # Absolute paths do not depend on the working directory, which may
+        # not even exist anymore.
+        return _absnorm(path, None if os.path.isabs(path) else os.getcwd())
 
     def _fail(self, *messages):
-        raise AssertionError(next(msg for msg in messages if msg))
+        for msg in messages:
+            if msg:
+                raise AssertionError(msg)
+        raise AssertionError()
 
     def _error(self, msg):
         raise RuntimeError(msg)
@@ -1452,33 +1607,119 @@ class OperatingSystem:
         logger.write(msg, level)
 
 
+def _is_ascii_compatible(encoding):
+    """Returns True if CR and LF bytes always mean newlines in the encoding."""
+    try:
+        name = codecs.lookup(encoding).name
+    except (LookupError, TypeError):
+        return False
+    return name in ("utf-8", "utf-8-sig", "ascii") or name.startswith(
+        ("iso8859-", "cp125")
+    )
+
+
+def _to_native_separators(path):
+    # `os.sep` is `/` everywhere else than on Windows.
+    return path.replace("/", os.sep) if WINDOWS else path
+
+
+def _normalize_path(path, case_normalize=False):
+    path = os.path.normpath(os.path.expanduser(_to_native_separators(path)))
+    # os.path.normcase doesn't normalize on OSX which also, by default,
+    # has case-insensitive file system. Our robot.utils.normpath would
+    # do that, but it's not certain would that, or other things that the
+    # utility do, desirable.
+    if case_normalize:
+        path = os.path.normcase(path)
+    return path or "."
+
+
+@lru_cache(maxsize=256)
+def _absnorm(path, cwd):
+    # `cwd` is part of the cache key because relative paths depend on it.
+    # It is `None` with absolute paths.
+    return abspath(_normalize_path(path))
+
+
+@lru_cache(maxsize=256)
+def _compile_glob_pattern(pattern):
+    return re.compile(fnmatch.translate(pattern))
+
+
+@lru_cache(maxsize=256)
+def _compile_grep_pattern(pattern, regexp=False):
+    if not regexp:
+        pattern = fnmatch.translate(f"{pattern}*")
+    return re.compile(pattern)
+
+
+def _create_temp_file(directory, attempts=100):
+    # The file is created exclusively and without following symlinks so that
+    # a file or a symlink planted with the same name cannot be written to.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    flags |= getattr(os, "O_NOFOLLOW", 0) | getattr(os, "O_BINARY", 0)
+    for attempt in range(1, attempts + 1):
+        name = f".robot-{os.getpid()}-{next(_TEMP_FILE_COUNTER)}.tmp"
+        path = os.path.join(directory, name)
+        try:
+            return os.open(path, flags, 0o600), path
+        except FileExistsError:
+            if attempt == attempts:
+                raise
+
+
+def _list_names(directory):
+    try:
+        return os.listdir(directory)
+    except OSError:
+        return []
+
+
+def _read_line_blocks(file, size=1024 * 1024):
+    """Yields lines read from a text file as lists, one list per block.
+
+    Reading in big blocks and splitting them avoids per-line iteration overhead.
+    Lines do not contain newlines and the last line is yielded also if the file
+    does not end with a newline.
+    """
+    rest = ""
+    while True:
+        block = file.read(size)
+        if not block:
+            break
+        lines = (rest + block).split("\n")
+        rest = lines.pop()
+        yield lines
+    if rest:
+        yield [rest]
+
+
 class _Process:
 
     def __init__(self, command):
         self._command = self._process_command(command)
-        self._process = os.popen(self._command)
+        # Same as `os.popen` but without its text wrapper and encoded return code.
+        self._process = subprocess.Popen(
+            self._command, shell=True, stdout=subprocess.PIPE, text=True
+        )
 
     def __str__(self):
         return self._command
 
     def read(self):
-        return self._process_output(self._process.read())
+        return self._process_output(self._process.stdout.read())
 
     def close(self):
         try:
-            rc = self._process.close()
+            self._process.stdout.close()
+            rc = self._process.wait()
         except IOError:  # Has occurred sometimes in Windows
             return 255
-        if rc is None:
-            return 0
         # In Windows return code is value returned by
         # command (can be almost anything)
-        # In other OS:
-        #   Return code must be converted with 'rc >> 8' and it is
-        #   between 0-255 after conversion
         if WINDOWS:
             return rc % 256
-        return rc >> 8
+        return rc
 
     def _process_command(self, command):
         if ">" not in command:
@@ -1489,8 +1730,7 @@ class _Process:
         return command
 
     def _process_output(self, output):
-        if "\r\n" in output:
-            output = output.replace("\r\n", "\n")
+        output = output.replace("\r\n", "\n")
         if output.endswith("\n"):
             output = output[:-1]
         return console_decode(output)
@@ -14,6 +14,7 @@
 #  limitations under the License.
 
 import os
+import select
 import signal as signal_module
 import subprocess
 import sys
@@ -22,6 +23,11 @@ from pathlib import Path
 from tempfile import TemporaryFile
 from typing import Any
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows.
+    fcntl = None
+
 from robot.api import logger
 from robot.errors import TimeoutExceeded
 from robot.utils import (
@@ -32,6 +38,9 @@ from robot.utils import (
 from robot.version import get_version
 
 LOCALE_ENCODING = "locale" if sys.version_info >= (3, 10) else None
+PIPE_SIZE = 1024 * 1024
+MAX_ENLARGED_PIPES = 16
+MAX_POLL_TIMEOUT = 2**31 - 1
 
 
 class Process:
@@ -331,6 +340,7 @@ class Process:
     def __init__(self):
         self._processes = ConnectionCache("No active process.")
         self._results = {}
+        self._enlarged_pipes = []
 
     def run_process(
         self,
@@ -467,19 +477,47 @@ class Process:
             env=env,
             **env_extra,
         )
-        command = conf.get_command(command, list(arguments))
+        command = conf.get_command(command, arguments)
         self._log_start(command, conf)
         process = subprocess.Popen(command, **conf.popen_config)
+        self._enlarge_output_pipes(process)
         self._results[process] = ExecutionResult(process, **conf.result_config)
         self._processes.register(process, alias=conf.alias)
         return self._processes.current
 
+    def _enlarge_output_pipes(self, process):
+        # Larger pipes mean fewer stalls and wake-ups with processes producing
+        # lots of output. Only supported on Linux. Not done with Popen's own
+        # `pipesize`, because it fails if the size exceeds system limits.
+        # Enlarged pipes count against the per-user `fs.pipe-user-pages-soft`
+        # quota and exceeding it shrinks all new pipes of the user to one page.
+        # Only a limited number of open pipes are thus enlarged at a time.
+        if not hasattr(fcntl, "F_SETPIPE_SZ"):
+            return
+        self._enlarged_pipes = [p for p in self._enlarged_pipes if not p.closed]
+        for pipe in process.stdout, process.stderr:
+            if pipe and len(self._enlarged_pipes) < MAX_ENLARGED_PIPES:
+                try:
+                    fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, PIPE_SIZE)
+                except OSError:
+                    pass
+                else:
+                    self._enlarged_pipes.append(pipe)
+
     def _log_start(self, command, config):
         if is_list_like(command):
             command = self.join_command_line(command)
         logger.info(f"Starting process:\n{system_decode(command)}")
         logger.debug(f"Process configuration:\n{config}")
 
+    def _get_process(self, handle):
+        # Popen objects returned by `Start Process` are the most common handles.
+        # ConnectionCache finds them with a linear search, but all registered
+        # processes are also keys in `self._results`.
+        if isinstance(handle, subprocess.Popen) and handle in self._results:
+            return handle
+        return self._processes[handle]
+
     def is_process_running(self, handle=None) -> bool:
         """Checks is the process running or not.
 
@@ -487,7 +525,7 @@ class Process:
 
         Returns ``True`` if the process is still running and ``False`` otherwise.
         """
-        return self._processes[handle].poll() is None
+        return self._get_process(handle).poll() is None
 
     def process_should_be_running(
         self,
@@ -568,7 +606,7 @@ class Process:
         to avoid leaving it running on the background. This is new in Robot
         Framework 7.3.
         """
-        process = self._processes[handle]
+        process = self._get_process(handle)
         logger.info("Waiting for process to complete.")
         timeout = self._get_timeout(timeout)
         if timeout > 0 and not self._process_is_stopped(process, timeout):
@@ -596,23 +634,34 @@ class Process:
         # https://github.com/python/cpython/issues/131064
         if process.stdin and process.stdin.closed:
             process.stdin = None
-        # Timeout is used with communicate() to support Robot's timeouts.
-        while True:
-            try:
-                result.stdout, result.stderr = process.communicate(timeout=0.1)
-            except subprocess.TimeoutExpired:
-                continue
-            except TimeoutExceeded:
-                logger.info("Timeout exceeded.")
-                self._kill(process)
-                raise
-            else:
-                break
+        try:
+            result.stdout, result.stderr = self._communicate(process)
+        except TimeoutExceeded:
+            logger.info("Timeout exceeded.")
+            self._kill(process)
+            raise
         result.rc = process.returncode
         result.close_streams()
         logger.info("Process completed.")
         return result
 
+    def _communicate(self, process):
+        # Without pipes there is nothing to read and waiting is enough. On POSIX
+        # Robot's timeouts are signal based and interrupt also blocking waits.
+        if not (WINDOWS or process.stdin or process.stdout or process.stderr):
+            process.wait()
+            return None, None
+        # Timeout is used with communicate() to support Robot's timeouts.
+        # On POSIX they are signal based and interrupt communicate() anyway,
+        # but on Windows they are noticed only after communicate() returns.
+        # Pipes are read as data arrives regardless the timeout.
+        timeout = 0.1 if WINDOWS else 1
+        while True:
+            try:
+                return process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                pass
+
     def terminate_process(self, handle=None, kill=False) -> Any:
         """Stops the process gracefully or forcefully.
 
@@ -644,7 +693,7 @@ class Process:
         - On Windows forceful kill only stops the main process, not possible
           child processes.
         """
-        process = self._processes[handle]
+        process = self._get_process(handle)
         if not hasattr(process, "terminate"):
             raise RuntimeError(
                 "Terminating processes is not supported by this Python version."
@@ -659,15 +708,24 @@ class Process:
         return self._wait(process)
 
     def _kill(self, process):
+        self._send_kill(process)
+        if not self._process_is_stopped(process, self.KILL_TIMEOUT):
+            raise RuntimeError("Failed to kill process.")
+
+    def _send_kill(self, process):
         logger.info("Forcefully killing process.")
         if hasattr(os, "killpg"):
             os.killpg(process.pid, signal_module.SIGKILL)
         else:
             process.kill()
-        if not self._process_is_stopped(process, self.KILL_TIMEOUT):
-            raise RuntimeError("Failed to kill process.")
 
     def _terminate(self, process):
+        self._send_terminate(process)
+        if not self._process_is_stopped(process, self.TERMINATE_TIMEOUT):
+            logger.info("Graceful termination failed.")
+            self._kill(process)
+
+    def _send_terminate(self, process):
         logger.info("Gracefully terminating process.")
         # Sends signal to the whole process group both on POSIX and on Windows
         # if supported by the interpreter.
@@ -677,9 +735,6 @@ class Process:
             process.send_signal(signal_module.CTRL_BREAK_EVENT)
         else:
             process.terminate()
-        if not self._process_is_stopped(process, self.TERMINATE_TIMEOUT):
-            logger.info("Graceful termination failed.")
-            self._kill(process)
 
     def terminate_all_processes(self, kill=False):
         """Terminates all still running processes started by this library.
@@ -689,13 +744,44 @@ class Process:
 
         Tries to terminate processes gracefully by default, but can be
         configured to forcefully kill them immediately. See `Terminate Process`
-        that this keyword uses internally for more details.
+        for more details about terminating and killing processes.
+
+        All processes are signaled first and only then waited for. Stopping
+        them thus takes at most as long as stopping one of them.
         """
-        for handle in range(1, len(self._processes) + 1):
-            if self.is_process_running(handle):
-                self.terminate_process(handle, kill=kill)
+        processes = [process for process in self._processes if process.poll() is None]
+        running = processes
+        if not kill:
+            self._send_to_all(self._send_terminate, running)
+            running = self._wait_for_all(running, self.TERMINATE_TIMEOUT)
+            if running:
+                logger.info("Graceful termination failed.")
+        if running:
+            self._send_to_all(self._send_kill, running)
+            if self._wait_for_all(running, self.KILL_TIMEOUT):
+                raise RuntimeError("Failed to kill process.")
+        for process in processes:
+            self._wait(process)
         self.__init__()
 
+    def _send_to_all(self, sender, processes):
+        for process in processes:
+            try:
+                sender(process)
+            except OSError:
+                # Process may have stopped after it was checked. If not,
+                # waiting for it to stop fails later.
+                logger.debug("Ignored OSError when sending signal.")
+
+    def _wait_for_all(self, processes, timeout):
+        # Returns processes that did not stop within the shared timeout.
+        max_time = time.time() + timeout
+        return [
+            process
+            for process in processes
+            if not self._process_is_stopped(process, max(max_time - time.time(), 0))
+        ]
+
     def send_signal_to_process(self, signal, handle=None, group=False):
         """Sends the given ``signal`` to the specified process.
 
@@ -725,7 +811,7 @@ class Process:
         """
         if os.sep == "\\":
             raise RuntimeError("This keyword does not work on Windows.")
-        process = self._processes[handle]
+        process = self._get_process(handle)
         signum = self._get_signal_number(signal)
         logger.info(f"Sending signal {signal} ({signum}).")
         if group and hasattr(os, "killpg"):
@@ -760,7 +846,7 @@ class Process:
         the ``pid`` attribute of the ``subprocess.Popen`` object returned by
         `Start Process` like ``${process.pid}``.
         """
-        return self._processes[handle].pid
+        return self._get_process(handle).pid
 
     def get_process_object(self, handle=None) -> Any:
         """Return the underlying ``subprocess.Popen`` object.
@@ -771,7 +857,7 @@ class Process:
         ``subprocess.Popen`` object, not a generic handle, making this keyword
         mostly redundant.
         """
-        return self._processes[handle]
+        return self._get_process(handle)
 
     def get_process_result(
         self,
@@ -821,7 +907,7 @@ class Process:
         support returning the whole result object, but individual attributes
         can be returned without problems.
         """
-        result = self._results[self._processes[handle]]
+        result = self._results[self._get_process(handle)]
         if result.rc is None:
             raise RuntimeError(
                 "Getting results of unfinished processes is not supported."
@@ -866,11 +952,33 @@ class Process:
         self._processes.switch(handle)
 
     def _process_is_stopped(self, process, timeout):
-        stopped = lambda: process.poll() is not None
-        max_time = time.time() + timeout
-        while time.time() <= max_time and not stopped():
-            time.sleep(min(0.1, timeout))
-        return stopped()
+        if process.poll() is None and not self._wait_for_exit(process, timeout):
+            max_time = time.time() + timeout
+            while time.time() <= max_time and process.poll() is None:
+                time.sleep(min(0.1, timeout))
+        return process.poll() is not None
+
+    def _wait_for_exit(self, process, timeout):
+        # Process file descriptors become readable when the process stops,
+        # which allows waiting without polling. They are supported on Linux
+        # 5.3+ with Python 3.9+. Robot's timeouts use signals on Linux and
+        # thus interrupt waiting. Returns False if waiting is not supported.
+        try:
+            fd = os.pidfd_open(process.pid)
+        except (AttributeError, OSError):
+            return False
+        try:
+            poller = select.poll()
+            poller.register(fd, select.POLLIN)
+            # `poll()` does not accept timeouts longer than INT_MAX milliseconds.
+            max_time = time.time() + timeout
+            while not poller.poll(min(timeout * 1000, MAX_POLL_TIMEOUT)):
+                timeout = max_time - time.time()
+                if timeout <= 0:
+                    break
+        finally:
+            os.close(fd)
+        return True
 
     def split_command_line(self, args, escaping=False) -> list:
         """Splits command line string into a list of arguments.
@@ -1058,11 +1166,20 @@ class ProcessConfiguration:
         path = os.path.normpath(os.path.join(self.cwd, stdin))
         if os.path.isfile(path):
             return open(path, encoding=LOCALE_ENCODING)
-        stdin_file = TemporaryFile()
+        stdin_file = self._new_stdin_file()
         stdin_file.write(console_encode(stdin, self.output_encoding, force=True))
         stdin_file.seek(0)
         return stdin_file
 
+    def _new_stdin_file(self):
+        # Anonymous in-memory file on Linux, temporary file elsewhere.
+        if hasattr(os, "memfd_create"):
+            try:
+                return open(os.memfd_create("robot-stdin"), "w+b")
+            except OSError:
+                pass
+        return TemporaryFile()
+
     def _construct_env(self, env, extra):
         env = self._get_initial_env(env, extra)
         if env is None:
@@ -1,4 +1,5 @@
 import unittest
+from datetime import datetime
 
 from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
 from robot.libraries.DateTime import Date
@@ -52,6 +53,19 @@ class TestDateTime(unittest.TestCase):
         secs = 1234567890
         assert_equal(Date(secs).seconds, secs)
 
+    def test_timestamp_with_non_ascii_digits(self):
+        for timestamp in [
+            "2014\u00b20528",
+            "\u0662\u0660\u0661\u0664-05-28",
+            "\uff12\uff10\uff11\uff14-05-28",
+        ]:
+            assert_raises_with_msg(
+                ValueError, f"Invalid timestamp '{timestamp}'.", Date, timestamp
+            )
+
+    def test_timestamp_with_non_ascii_separators(self):
+        assert_equal(Date("2014\u20130528").datetime, datetime(2014, 5, 28))
+
 
 if __name__ == "__main__":
     unittest.main()